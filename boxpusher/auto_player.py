@@ -3,11 +3,15 @@ from box_game.game_window import GameWindowObserver, BoxPusherWindow
 
 
 class AutoPlayer:
+    __slots__ = ()
+
     def next_move(self, engine):
         pass
 
 
 class AutomaticMaster(GameWindowObserver):
+    __slots__ = ('engine', 'player', 'auto_close', 'window')
+
     def __init__(self, engine: BoxPusherEngine, player: AutoPlayer,
                  close_automatically=False, disable_text=False):
         self.engine = engine
@@ -39,6 +43,8 @@ DEMO_LEVEL = Level(
 
 
 class DemoPlayer(AutoPlayer):
+    __slots__ = ('move_ix', 'moves')
+
     def __init__(self):
         self.move_ix = -1
         self.moves = [
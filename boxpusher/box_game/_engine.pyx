@@ -0,0 +1,100 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+from .game_engine import GameListener, MOVES, BOX_REWARD
+
+
+cdef class CyBoxPusherEngine:
+    cdef public tuple field_size
+    cdef public set walls, boxes
+    cdef public int points
+    cdef public bint game_won, game_lost
+    cdef public object listeners
+    cdef list box_order
+    cdef int px, py, gx, gy, width, height
+
+    def __init__(self, level):
+        self.field_size = tuple(level.field_size)
+        self.width, self.height = self.field_size
+        self.px, self.py = level.player
+        self.walls = {tuple(wall_pos) for wall_pos in level.walls}
+        self.box_order = [tuple(box_pos) for box_pos in level.boxes]
+        self.boxes = set(self.box_order)
+        self.gx, self.gy = level.goal
+        for box in self.boxes:
+            assert box != self.goal, "box cannot have same position as goal: {}".format(box)
+
+        self.points = level.max_points
+        self.game_won = False
+        self.game_lost = False
+        self.listeners = GameListener()
+
+    @property
+    def player(self):
+        return self.px, self.py
+
+    @property
+    def goal(self):
+        return self.gx, self.gy
+
+    def game_over(self):
+        return self.game_won or self.game_lost
+
+    def first_box(self):
+        return self.box_order[0]
+
+    def player_move(self, direction):
+        cdef int dx, dy, nx, ny
+        cdef bint can_move
+        if self.game_won or self.game_lost:
+            return
+
+        self.points -= 1
+
+        dx, dy = MOVES[direction - 1]
+        nx, ny = self.px + dx, self.py + dy
+        can_move = self.is_free(nx, ny)
+        if not can_move:
+            self.listeners.invalid_move()
+        else:
+            can_move = self.check_boxes(nx, ny, dx, dy)
+
+        if len(self.boxes) <= 0:
+            self.game_won = True
+        if self.points <= 0:
+            self.game_lost = True
+
+        if can_move:
+            self.px, self.py = nx, ny
+        self.listeners.new_position(self.player)
+
+    cdef bint check_boxes(self, int bx, int by, int dx, int dy):
+        cdef int nx = bx + dx, ny = by + dy
+        cdef Py_ssize_t box_ix
+        if (bx, by) not in self.boxes:
+            return True
+        if self.is_occupied(nx, ny):
+            self.listeners.invalid_move()
+            return False
+        self.listeners.box_move()
+        self.boxes.remove((bx, by))
+        box_ix = self.box_order.index((bx, by))
+        if self.is_goal(nx, ny):
+            self.points += BOX_REWARD
+            self.listeners.box_in_goal()
+            del self.box_order[box_ix]
+        else:
+            self.boxes.add((nx, ny))
+            self.box_order[box_ix] = (nx, ny)
+        return True
+
+    def can_move_to(self, position):
+        return self.is_free(position[0], position[1])
+
+    cdef inline bint is_free(self, int x, int y):
+        return 0 <= x < self.width and 0 <= y < self.height and (x, y) not in self.walls
+
+    cdef inline bint is_occupied(self, int x, int y):
+        return not self.is_free(x, y) or (x, y) in self.boxes
+
+    cdef inline bint is_goal(self, int x, int y):
+        return x == self.gx and y == self.gy
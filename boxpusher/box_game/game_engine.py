@@ -1,9 +1,7 @@
-from enum import Enum, auto
+from enum import IntEnum, auto
 
-from numpy import array
 
-
-class Direction(Enum):
+class Direction(IntEnum):
     UP = auto()
     DOWN = auto()
     LEFT = auto()
@@ -11,13 +9,7 @@ class Direction(Enum):
     HALT = auto()
 
 
-MOVE_VECTOR = {
-    Direction.UP: array([0, 1]),
-    Direction.DOWN: array([0, -1]),
-    Direction.LEFT: array([-1, 0]),
-    Direction.RIGHT: array([1, 0]),
-    Direction.HALT: array([0, 0])
-}
+MOVES = ((0, 1), (0, -1), (-1, 0), (1, 0), (0, 0))
 BOX_REWARD = 10
 
 
@@ -72,15 +64,16 @@ class GameListener:
             listener.invalid_move()
 
 
-class BoxPusherEngine:
+class PyBoxPusherEngine:
     def __init__(self, level: Level):
         self.field_size = level.field_size
-        self.player = array(level.player)
-        self.walls = level.walls
-        self.boxes = [array(box_pos) for box_pos in level.boxes]
-        self.goal = level.goal
+        self.player = tuple(level.player)
+        self.walls = {tuple(wall_pos) for wall_pos in level.walls}
+        self.__box_order = [tuple(box_pos) for box_pos in level.boxes]
+        self.boxes = set(self.__box_order)
+        self.goal = tuple(level.goal)
         for box in self.boxes:
-            assert not (box == self.goal).all(), "box cannot have same position as goal: {}".format(box)
+            assert box != self.goal, "box cannot have same position as goal: {}".format(box)
 
         self.points = level.max_points
         self.game_won = False
@@ -90,59 +83,72 @@ class BoxPusherEngine:
     def game_over(self):
         return self.game_won or self.game_lost
 
+    def first_box(self):
+        return self.__box_order[0]
+
     def player_move(self, direction):
         if self.game_over():
             return
 
         self.points -= 1
 
-        move = MOVE_VECTOR[direction]
-        new_pos = self.player + move
-        if not self.can_move_to(new_pos):
-            move = MOVE_VECTOR[Direction.HALT]
+        dx, dy = MOVES[direction - 1]
+        new_pos = self.player[0] + dx, self.player[1] + dy
+        can_move = self.can_move_to(new_pos)
+        if not can_move:
             self.listeners.invalid_move()
         else:
-            move = self.__check_boxes__(new_pos, move)
+            can_move = self.__check_boxes__(new_pos, dx, dy)
 
         if len(self.boxes) <= 0:
             self.game_won = True
         if self.points <= 0:
             self.game_lost = True
 
-        self.player += move
+        if can_move:
+            self.player = new_pos
         self.listeners.new_position(self.player)
 
-    def __check_boxes__(self, player_pos, move):
-        for ix, box in enumerate(self.boxes):
-            if (box == player_pos).all():
-                new_box_pos = box + move
-                if self.__is_occupied__(new_box_pos):
-                    move = MOVE_VECTOR[Direction.HALT]
-                    self.listeners.invalid_move()
-                else:
-                    self.listeners.box_move()
-                if self.__is_goal__(new_box_pos):
-                    self.points += BOX_REWARD
-                    self.listeners.box_in_goal()
-                    del self.boxes[ix]
-                else:
-                    self.boxes[ix] += move
-        return move
+    def __check_boxes__(self, player_pos, dx, dy):
+        if player_pos not in self.boxes:
+            return True
+        new_box_pos = player_pos[0] + dx, player_pos[1] + dy
+        if self.__is_occupied__(new_box_pos):
+            self.listeners.invalid_move()
+            return False
+        self.listeners.box_move()
+        self.boxes.remove(player_pos)
+        box_ix = self.__box_order.index(player_pos)
+        if self.__is_goal__(new_box_pos):
+            self.points += BOX_REWARD
+            self.listeners.box_in_goal()
+            del self.__box_order[box_ix]
+        else:
+            self.boxes.add(new_box_pos)
+            self.__box_order[box_ix] = new_box_pos
+        return True
 
     def can_move_to(self, position):
-        return not self.positions_contains(self.walls, position) \
+        return position not in self.walls \
                and 0 <= position[0] < self.field_size[0] \
                and 0 <= position[1] < self.field_size[1]
 
     def __is_occupied__(self, position):
-        return not self.can_move_to(position) or self.positions_contains(self.boxes, position)
+        return not self.can_move_to(position) or position in self.boxes
 
     def __is_goal__(self, position):
-        return (self.goal == position).all()
-
-    @staticmethod
-    def positions_contains(all_pos, pos):
-        for p in all_pos:
-            if (p == pos).all():
-                return True
-        return False
+        return self.goal == position
+
+
+def move_position(position, move):
+    return position[0] + move[0], position[1] + move[1]
+
+
+try:
+    from ._engine import CyBoxPusherEngine
+
+    BoxPusherEngine = CyBoxPusherEngine
+    ENGINE_CORE_ENABLED = True
+except ImportError:
+    BoxPusherEngine = PyBoxPusherEngine
+    ENGINE_CORE_ENABLED = False
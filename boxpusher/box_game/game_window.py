@@ -27,6 +27,8 @@ AUTOMATIC_MOVES_DELAY = 0.7
 
 
 class GameWindowObserver:
+    __slots__ = ()
+
     def next_move(self):
         pass
 
@@ -58,7 +58,7 @@ class StepFitnessCalculator(FitnessCalculator):
 
     def __position_distances__(self):
         return (
-            distance_between(self.engine.player, self.engine.boxes[0]),
+            distance_between(self.engine.player, self.engine.first_box()),
             distance_sum_between(self.engine.boxes, self.engine.goal)
         )
 
@@ -219,9 +219,6 @@ class CoveredPositions:
         self.covered_positions = []
 
     def count_on(self, pos):
-        count = 0
-        for p in self.covered_positions:
-            if (p == pos).all():
-                count += 1
-        self.covered_positions.append(pos.copy())
+        count = self.covered_positions.count(pos)
+        self.covered_positions.append(pos)
         return count
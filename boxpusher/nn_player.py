@@ -3,7 +3,7 @@ import numpy as np
 
 from auto_player import AutomaticMaster, AutoPlayer
 from fitness_calc import create_fitness_calculator
-from box_game.game_engine import BoxPusherEngine, Level, Direction, MOVE_VECTOR
+from box_game.game_engine import BoxPusherEngine, Level, Direction, MOVES, move_position
 from box_game.training_levels import generate_level
 from training_reporter import FITNESS_FORMAT
 
@@ -65,6 +65,8 @@ class NeuralNetMaster:
 
 
 class GameState:
+    __slots__ = ('engine', 'norm_width', 'norm_height', 'grid_template')
+
     def __init__(self, engine: BoxPusherEngine):
         self.engine = engine
         self.norm_width = engine.field_size[0] - 1
@@ -77,13 +79,13 @@ class GameState:
     def __player_relative_state__(self):
         return np.concatenate((
             self.__norm_distance__(self.engine.player, self.engine.goal),
-            self.__norm_distance__(self.engine.player, self.engine.boxes[0])
+            self.__norm_distance__(self.engine.player, self.engine.first_box())
         ))
 
     def __all_relative_state__(self):
         return np.concatenate((
-            self.__norm_distance__(self.engine.player, self.engine.boxes[0]),
-            self.__norm_distance__(self.engine.boxes[0], self.engine.goal)
+            self.__norm_distance__(self.engine.player, self.engine.first_box()),
+            self.__norm_distance__(self.engine.first_box(), self.engine.goal)
         ))
 
     def __positional_state__(self):
@@ -96,12 +98,12 @@ class GameState:
         return \
             self.__norm_position__(self.engine.player) + \
             self.__norm_position__(self.engine.goal) + \
-            self.__norm_position__(self.engine.boxes[0])
+            self.__norm_position__(self.engine.first_box())
 
     def __grid_state__(self):
         grid = self.grid_template.copy()
         grid[self.__position_ix__(self.engine.player)] = 0.25
-        grid[self.__position_ix__(self.engine.boxes[0])] = 0.5
+        grid[self.__position_ix__(self.engine.first_box())] = 0.5
         grid[self.__position_ix__(self.engine.goal)] += 0.75
         return grid
 
@@ -112,15 +114,16 @@ class GameState:
         return [pos[0] / self.norm_width, pos[1] / self.norm_height]
 
     def __norm_direction__(self, direction):
-        return 1.0 if self.engine.can_move_to(self.engine.player + MOVE_VECTOR[direction]) \
+        return 1.0 if self.engine.can_move_to(move_position(self.engine.player, MOVES[direction - 1])) \
             else 0.0
 
     def __norm_distance__(self, pos_a, pos_b):
-        diff = pos_b - pos_a
-        return diff[0] / self.norm_width, diff[1] / self.norm_height
+        return (pos_b[0] - pos_a[0]) / self.norm_width, (pos_b[1] - pos_a[1]) / self.norm_height
 
 
 class NeuralNetPlayer(AutoPlayer):
+    __slots__ = ('net', 'game_state', 'directions')
+
     def __init__(self, game_state: GameState, genome, config):
         self.net = neat.nn.RecurrentNetwork.create(genome, config)
         self.game_state = game_state
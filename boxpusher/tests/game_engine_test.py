@@ -0,0 +1,71 @@
+import random
+import unittest
+
+from box_game.game_engine import ENGINE_CORE_ENABLED, PyBoxPusherEngine, BoxPusherEngine, GameListener, Direction, \
+    Level, MOVES, move_position
+from box_game.manual_levels import LEVELS
+from box_game.training_levels import generate_level
+
+RANDOM_GAMES = 300
+MAX_MOVES = 200
+
+
+class EventLog(GameListener):
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def new_position(self, pos):
+        self.events.append(('position', tuple(pos)))
+
+    def box_move(self):
+        self.events.append('box_move')
+
+    def box_in_goal(self):
+        self.events.append('box_in_goal')
+
+    def invalid_move(self):
+        self.events.append('invalid_move')
+
+
+def near_goal_level(rnd):
+    box = rnd.randrange(1, 4), rnd.randrange(1, 4)
+    goal = move_position(box, rnd.choice(MOVES[:4]))
+    player = rnd.choice([(x, y) for x in range(5) for y in range(5) if (x, y) not in (box, goal)])
+    return Level((5, 5), player, [], [box], goal, max_points=20)
+
+
+def engine_state(engine):
+    first_box = engine.first_box() if engine.boxes else None
+    return engine.player, sorted(engine.boxes), first_box, engine.points, engine.game_won, engine.game_lost
+
+
+@unittest.skipUnless(ENGINE_CORE_ENABLED, 'Cython engine not built')
+class CyBoxPusherEngineTestCase(unittest.TestCase):
+    def test_uses_cython_engine(self):
+        self.assertIsNot(PyBoxPusherEngine, BoxPusherEngine)
+
+    def test_replays_random_games_like_python_engine(self):
+        rnd = random.Random(5)
+        random.seed(5)
+        levels = list(LEVELS) + [generate_level() for _ in range(RANDOM_GAMES)] + \
+                 [near_goal_level(rnd) for _ in range(RANDOM_GAMES)]
+        games_won = 0
+        for level_ix, level in enumerate(levels):
+            py_engine, cy_engine = PyBoxPusherEngine(level), BoxPusherEngine(level)
+            py_log, cy_log = EventLog(), EventLog()
+            py_engine.listeners.add(py_log)
+            cy_engine.listeners.add(cy_log)
+            self.assertEqual(engine_state(py_engine), engine_state(cy_engine))
+
+            moves = 0
+            while not py_engine.game_over() and moves < MAX_MOVES:
+                direction = rnd.choice(list(Direction))
+                py_engine.player_move(direction)
+                cy_engine.player_move(direction)
+                self.assertEqual(engine_state(py_engine), engine_state(cy_engine), f'level {level_ix}, move {moves}')
+                moves += 1
+            self.assertEqual(py_engine.game_over(), cy_engine.game_over())
+            self.assertEqual(py_log.events, cy_log.events, f'level {level_ix}')
+            games_won += py_engine.game_won
+        self.assertGreater(games_won, 0)
@@ -94,6 +94,8 @@ class DemoController(RaceController):
 
 
 class DemoPlayer:
+    __slots__ = ('time_delay', 'level', 'engine', 'next_step_ix', 'next_step')
+
     def __init__(self, level, time_delay=0):
         self.time_delay, self.level = time_delay, level
         self.engine = RacerEngine(self.level)
@@ -0,0 +1,122 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+
+from libc.math cimport cos, sin, fabs
+
+cdef bint pip_ring(double px, double py, const float[:, ::1] ring_xy) noexcept nogil:
+    cdef bint inside = False
+    cdef Py_ssize_t ix
+    cdef double x0, y0, x1, y1
+    for ix in range(ring_xy.shape[0] - 1):
+        x0, y0 = ring_xy[ix, 0], ring_xy[ix, 1]
+        x1, y1 = ring_xy[ix + 1, 0], ring_xy[ix + 1, 1]
+        if (y0 > py) != (y1 > py):
+            if px < x0 + (py - y0) * (x1 - x0) / (y1 - y0):
+                inside = not inside
+    return inside
+
+
+cdef bint crosses_ring(const double[:, ::1] points, const float[:, ::1] ring_xy) noexcept nogil:
+    cdef Py_ssize_t pt_ix, next_ix, ix
+    cdef double ax, ay, ex, ey, qx, qy, dx, dy, k, side_a, side_b
+    for pt_ix in range(points.shape[0]):
+        ax, ay = points[pt_ix, 0], points[pt_ix, 1]
+        next_ix = (pt_ix + 1) % points.shape[0]
+        ex, ey = points[next_ix, 0] - ax, points[next_ix, 1] - ay
+        for ix in range(ring_xy.shape[0] - 1):
+            qx, qy = ring_xy[ix, 0] - ax, ring_xy[ix, 1] - ay
+            dx, dy = ring_xy[ix + 1, 0] - ring_xy[ix, 0], ring_xy[ix + 1, 1] - ring_xy[ix, 1]
+            k = ex * dy - ey * dx
+            side_a = ex * qy - ey * qx
+            side_b = dy * qx - dx * qy
+            if side_a * (side_a + k) < 0 and side_b * (side_b - k) < 0:
+                return True
+    return False
+
+
+cdef bint separated(const double[:, ::1] box_a, const double[:, ::1] box_b) noexcept nogil:
+    cdef Py_ssize_t box_ix, ix, pt_ix
+    cdef double ax, ay, proj, min_a, max_a, min_b, max_b
+    cdef const double[:, ::1] box
+    for box_ix in range(2):
+        box = box_a if box_ix == 0 else box_b
+        for ix in range(2):
+            ax, ay = box[ix, 1] - box[ix + 1, 1], box[ix + 1, 0] - box[ix, 0]
+            min_a = max_a = box_a[0, 0] * ax + box_a[0, 1] * ay
+            for pt_ix in range(1, box_a.shape[0]):
+                proj = box_a[pt_ix, 0] * ax + box_a[pt_ix, 1] * ay
+                min_a, max_a = min(min_a, proj), max(max_a, proj)
+            min_b = max_b = box_b[0, 0] * ax + box_b[0, 1] * ay
+            for pt_ix in range(1, box_b.shape[0]):
+                proj = box_b[pt_ix, 0] * ax + box_b[pt_ix, 1] * ay
+                min_b, max_b = min(min_b, proj), max(max_b, proj)
+            if max_a < min_b or max_b < min_a:
+                return True
+    return False
+
+
+cdef bint boxes_intersect(const double[:, ::1] points, const double[:, :, ::1] boxes) noexcept nogil:
+    cdef Py_ssize_t ix, box_ix
+    cdef double min_x, min_y, max_x, max_y, box_min_x, box_min_y, box_max_x, box_max_y
+    min_x = max_x = points[0, 0]
+    min_y = max_y = points[0, 1]
+    for ix in range(1, points.shape[0]):
+        min_x, max_x = min(min_x, points[ix, 0]), max(max_x, points[ix, 0])
+        min_y, max_y = min(min_y, points[ix, 1]), max(max_y, points[ix, 1])
+    for box_ix in range(boxes.shape[0]):
+        box_min_x = box_max_x = boxes[box_ix, 0, 0]
+        box_min_y = box_max_y = boxes[box_ix, 0, 1]
+        for ix in range(1, boxes.shape[1]):
+            box_min_x, box_max_x = min(box_min_x, boxes[box_ix, ix, 0]), max(box_max_x, boxes[box_ix, ix, 0])
+            box_min_y, box_max_y = min(box_min_y, boxes[box_ix, ix, 1]), max(box_max_y, boxes[box_ix, ix, 1])
+        if box_max_x < min_x or max_x < box_min_x or box_max_y < min_y or max_y < box_min_y:
+            continue
+        if not separated(points, boxes[box_ix]):
+            return True
+    return False
+
+
+cdef bint contains_car(const double[:, ::1] points, const float[:, ::1] outer, const float[:, ::1] inner,
+                       const double[:, :, ::1] obstacles) noexcept nogil:
+    cdef Py_ssize_t ix
+    for ix in range(points.shape[0]):
+        if not pip_ring(points[ix, 0], points[ix, 1], outer) or pip_ring(points[ix, 0], points[ix, 1], inner):
+            return False
+    return not (crosses_ring(points, outer) or crosses_ring(points, inner) or boxes_intersect(points, obstacles))
+
+
+def track_contains(const double[:, ::1] points, const float[:, ::1] outer, const float[:, ::1] inner,
+                   const double[:, :, ::1] obstacles):
+    cdef bint result
+    with nogil:
+        result = contains_car(points, outer, inner, obstacles)
+    return result
+
+
+cdef void trace_lines(double px, double py, double rot, const double[::1] angles, const double[:, ::1] segments,
+                      double trace_len, double[::1] out) noexcept nogil:
+    cdef Py_ssize_t ix, seg_ix
+    cdef double dx, dy, x0, y0, ex, ey, qx, qy, t, u, denominator, closest_t
+    cdef bint found
+    for ix in range(angles.shape[0]):
+        dx, dy = cos(rot + angles[ix]) * trace_len, -sin(rot + angles[ix]) * trace_len
+        found, closest_t = False, 1.0
+        for seg_ix in range(segments.shape[0]):
+            x0, y0 = segments[seg_ix, 0], segments[seg_ix, 1]
+            ex, ey = segments[seg_ix, 2] - x0, segments[seg_ix, 3] - y0
+            denominator = dx * ey - dy * ex
+            if denominator == 0:
+                continue
+            qx, qy = x0 - px, y0 - py
+            t = (qx * ey - qy * ex) / denominator
+            u = (qx * dy - qy * dx) / denominator
+            if 0 <= t <= 1 and 0 <= u <= 1 and (not found or t < closest_t):
+                found, closest_t = True, t
+        out[ix] = closest_t * (fabs(dx) + fabs(dy)) if found else trace_len
+
+
+def trace_distances(double px, double py, double rot, const double[::1] angles, const double[:, ::1] segments,
+                    double trace_len, out):
+    cdef double[::1] out_view = out
+    with nogil:
+        trace_lines(px, py, rot, angles, segments, trace_len, out_view)
+    return out
@@ -0,0 +1,163 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_ENABLED = True
+except ImportError:
+    NUMBA_ENABLED = False
+
+    def njit(*_, **__):
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def pip_ring(px, py, ring_xy):
+    inside = False
+    for ix in range(len(ring_xy) - 1):
+        x0, y0 = ring_xy[ix, 0], ring_xy[ix, 1]
+        x1, y1 = ring_xy[ix + 1, 0], ring_xy[ix + 1, 1]
+        if (y0 > py) != (y1 > py):
+            if px < x0 + (py - y0) * (x1 - x0) / (y1 - y0):
+                inside = not inside
+    return inside
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def crosses_ring(points, ring_xy):
+    for pt_ix in range(len(points)):
+        ax, ay = points[pt_ix, 0], points[pt_ix, 1]
+        next_ix = (pt_ix + 1) % len(points)
+        ex, ey = points[next_ix, 0] - ax, points[next_ix, 1] - ay
+        for ix in range(len(ring_xy) - 1):
+            qx, qy = ring_xy[ix, 0] - ax, ring_xy[ix, 1] - ay
+            dx, dy = ring_xy[ix + 1, 0] - ring_xy[ix, 0], ring_xy[ix + 1, 1] - ring_xy[ix, 1]
+            k = ex * dy - ey * dx
+            side_a = ex * qy - ey * qx
+            side_b = dy * qx - dx * qy
+            if side_a * (side_a + k) < 0 and side_b * (side_b - k) < 0:
+                return True
+    return False
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def separated(box_a, box_b):
+    for box in (box_a, box_b):
+        for ix in range(2):
+            ax, ay = box[ix, 1] - box[ix + 1, 1], box[ix + 1, 0] - box[ix, 0]
+            min_a = max_a = box_a[0, 0] * ax + box_a[0, 1] * ay
+            for pt_ix in range(1, len(box_a)):
+                proj = box_a[pt_ix, 0] * ax + box_a[pt_ix, 1] * ay
+                min_a, max_a = min(min_a, proj), max(max_a, proj)
+            min_b = max_b = box_b[0, 0] * ax + box_b[0, 1] * ay
+            for pt_ix in range(1, len(box_b)):
+                proj = box_b[pt_ix, 0] * ax + box_b[pt_ix, 1] * ay
+                min_b, max_b = min(min_b, proj), max(max_b, proj)
+            if max_a < min_b or max_b < min_a:
+                return True
+    return False
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def boxes_intersect(points, boxes):
+    min_x, min_y = max_x, max_y = points[0, 0], points[0, 1]
+    for ix in range(1, len(points)):
+        min_x, max_x = min(min_x, points[ix, 0]), max(max_x, points[ix, 0])
+        min_y, max_y = min(min_y, points[ix, 1]), max(max_y, points[ix, 1])
+    for box_ix in range(len(boxes)):
+        box = boxes[box_ix]
+        if box[:, 0].max() < min_x or max_x < box[:, 0].min() or box[:, 1].max() < min_y or max_y < box[:, 1].min():
+            continue
+        if not separated(points, box):
+            return True
+    return False
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def track_contains(points, outer_xy, inner_xy, obstacles):
+    for ix in range(len(points)):
+        if not pip_ring(points[ix, 0], points[ix, 1], outer_xy) or pip_ring(points[ix, 0], points[ix, 1], inner_xy):
+            return False
+    return not (crosses_ring(points, outer_xy) or crosses_ring(points, inner_xy) or boxes_intersect(points, obstacles))
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def project_point_on_ring(px, py, ring_xy, cum_len):
+    found, best_sq_dist, best_len = False, 0.0, 0.0
+    for ix in range(len(ring_xy) - 1):
+        x0, y0 = ring_xy[ix, 0], ring_xy[ix, 1]
+        dx, dy = ring_xy[ix + 1, 0] - x0, ring_xy[ix + 1, 1] - y0
+        seg_sq_len = dx * dx + dy * dy
+        t = 0.0
+        if seg_sq_len > 0:
+            t = min(1.0, max(0.0, ((px - x0) * dx + (py - y0) * dy) / seg_sq_len))
+        cx, cy = x0 + t * dx - px, y0 + t * dy - py
+        sq_dist = cx * cx + cy * cy
+        if not found or sq_dist < best_sq_dist:
+            found, best_sq_dist = True, sq_dist
+            best_len = cum_len[ix] + t * (cum_len[ix + 1] - cum_len[ix])
+    return best_len
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def project_point_on_rings(px, py, outer_xy, outer_len, inner_xy, inner_len):
+    return project_point_on_ring(px, py, outer_xy, outer_len), project_point_on_ring(px, py, inner_xy, inner_len)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def interpolate_ring(ring_xy, cum_len, d):
+    d = min(max(d, 0.0), cum_len[-1])
+    ix = min(max(np.searchsorted(cum_len, d) - 1, 0), len(cum_len) - 2)
+    seg_len = cum_len[ix + 1] - cum_len[ix]
+    t = (d - cum_len[ix]) / seg_len if seg_len > 0 else 0.0
+    x0, y0 = ring_xy[ix, 0], ring_xy[ix, 1]
+    return x0 + t * (ring_xy[ix + 1, 0] - x0), y0 + t * (ring_xy[ix + 1, 1] - y0)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def trace_distances(px, py, rot, angles, segments, trace_len, out):
+    for ix in range(len(angles)):
+        dx, dy = math.cos(rot + angles[ix]) * trace_len, -math.sin(rot + angles[ix]) * trace_len
+        found, closest_t = False, 1.0
+        for seg_ix in range(len(segments)):
+            x0, y0 = segments[seg_ix, 0], segments[seg_ix, 1]
+            ex, ey = segments[seg_ix, 2] - x0, segments[seg_ix, 3] - y0
+            denominator = dx * ey - dy * ex
+            if denominator == 0:
+                continue
+            qx, qy = x0 - px, y0 - py
+            t = (qx * ey - qy * ex) / denominator
+            u = (qx * dy - qy * dx) / denominator
+            if 0 <= t <= 1 and 0 <= u <= 1 and (not found or t < closest_t):
+                found, closest_t = True, t
+        out[ix] = closest_t * (abs(dx) + abs(dy)) if found else trace_len
+    return out
+
+
+def closed_ring(track):
+    ring_xy = np.reshape(np.asarray(track, dtype=np.float32), (-1, 2))
+    if (ring_xy[0] != ring_xy[-1]).any():
+        ring_xy = np.vstack((ring_xy, ring_xy[:1]))
+    return np.ascontiguousarray(ring_xy)
+
+
+def cumulative_lengths(ring_xy):
+    seg_len = np.hypot(*np.diff(ring_xy.astype(np.float64), axis=0).T)
+    return np.concatenate(((0.0,), np.cumsum(seg_len)))
+
+
+def __warm_up():
+    ring_xy = closed_ring([0, 0, 10, 0, 10, 10, 0, 10])
+    cum_len = cumulative_lengths(ring_xy)
+    car_points = ring_xy[:-1].astype(np.float64) * 0.5
+    track_contains(car_points, ring_xy, ring_xy, car_points[np.newaxis] + 20)
+    outer_dist, _ = project_point_on_rings(5.0, 5.0, ring_xy, cum_len, ring_xy, cum_len)
+    interpolate_ring(ring_xy, cum_len, outer_dist)
+    segments = np.hstack((ring_xy[:-1], ring_xy[1:])).astype(np.float64)
+    trace_distances(5.0, 5.0, 0.0, np.zeros(1), segments, 20, np.empty(1))
+
+
+if NUMBA_ENABLED:
+    __warm_up()
@@ -1,80 +1,99 @@
 import math
 
 import numpy as np
-from shapely.geometry import Polygon, LinearRing, Point
+import shapely
+from shapely.geometry import Polygon
+from shapely.prepared import prep
 
-from .tracks import Level
+from ._geom_numba import NUMBA_ENABLED, track_contains as nb_track_contains, project_point_on_rings, \
+    interpolate_ring, closed_ring, cumulative_lengths
+from .tracks import Level, SHAPELY_2
+
+try:
+    from ._engine_core import track_contains as cy_track_contains
+
+    ENGINE_CORE_ENABLED = True
+except ImportError:
+    ENGINE_CORE_ENABLED = False
+
+if NUMBA_ENABLED:
+    track_contains = nb_track_contains
+elif ENGINE_CORE_ENABLED:
+    track_contains = cy_track_contains
+else:
+    track_contains = None
+
+car_polygon = shapely.polygons if SHAPELY_2 else Polygon
 
 CAR_BOUNDS = (-15, -11, 33, 11)
 CAR_BOUND_POINTS = (CAR_BOUNDS[0], CAR_BOUNDS[1], CAR_BOUNDS[2], CAR_BOUNDS[1],
                     CAR_BOUNDS[2], CAR_BOUNDS[3], CAR_BOUNDS[0], CAR_BOUNDS[3]
                     )
-CAR_COLL_BOX = np.reshape(CAR_BOUND_POINTS, (-1, 2)) * 0.95
+CAR_COLL_BOX = np.ascontiguousarray(np.reshape(CAR_BOUND_POINTS, (-1, 2)) * 0.95, dtype=np.float64)
+CAR_COLL_BOX.setflags(write=False)
 MAX_CAR_SPEED = 300
 MAX_CAR_ROTATION = 200
 CAR_FRICTION = 0.98
 MIN_SPEED = 10
+DEFAULT_TRACK_DISTANCE = True
 
-BOX_COLL_BOX = np.array([[-18, -18], [18, -18], [18, 18], [-18, 18]])
+ROTATION_STEPS_PER_DEGREE = 10
+ROTATION_STEPS = 360 * ROTATION_STEPS_PER_DEGREE
+ROTATION_STEP_RADIANS = np.radians(np.arange(ROTATION_STEPS) / ROTATION_STEPS_PER_DEGREE)
+COSINE_TABLE = np.cos(ROTATION_STEP_RADIANS).tolist()
+SINE_TABLE = np.sin(ROTATION_STEP_RADIANS).tolist()
+
+BOX_COLL_BOX = np.array([[-18, -18], [18, -18], [18, 18], [-18, 18]], dtype=np.float64)
+BOX_COLL_BOX.setflags(write=False)
 
 
 class PlayerOperation:
-    FWD_IX = 0
-    REV_IX = 1
-    LEFT_IX = 2
-    RIGHT_IX = 3
+    __slots__ = ('_bits',)
+
+    FWD = 1
+    REV = 2
+    LEFT = 4
+    RIGHT = 8
+    MOVE_FACTORS = 0, 1, -1, 0
+    TURN_FACTORS = 0, -1, 1, 0
 
     def __init__(self):
-        self._data = [False] * 4
+        self._bits = 0
 
     def get_move_factor(self):
-        if self._data[self.FWD_IX]:
-            return 1
-        if self._data[self.REV_IX]:
-            return -1
-        return 0
+        return self.MOVE_FACTORS[self._bits & 3]
 
     def get_turn_factor(self):
-        if self._data[self.LEFT_IX]:
-            return -1
-        if self._data[self.RIGHT_IX]:
-            return 1
-        return 0
+        return self.TURN_FACTORS[self._bits >> 2]
 
     def accelerate(self):
-        self._data[self.FWD_IX] = True
-        self._data[self.REV_IX] = False
+        self._bits = (self._bits & ~self.REV) | self.FWD
 
     def reverse(self):
-        self._data[self.FWD_IX] = False
-        self._data[self.REV_IX] = True
+        self._bits = (self._bits & ~self.FWD) | self.REV
 
     def stop_direction(self):
-        self._data[self.FWD_IX] = False
-        self._data[self.REV_IX] = False
+        self._bits &= ~(self.FWD | self.REV)
 
     def turn_left(self):
-        self._data[self.LEFT_IX] = True
-        self._data[self.RIGHT_IX] = False
+        self._bits = (self._bits & ~self.RIGHT) | self.LEFT
 
     def turn_right(self):
-        self._data[self.LEFT_IX] = False
-        self._data[self.RIGHT_IX] = True
+        self._bits = (self._bits & ~self.LEFT) | self.RIGHT
 
     def stop_left(self):
-        self._data[self.LEFT_IX] = False
+        self._bits &= ~self.LEFT
 
     def stop_right(self):
-        self._data[self.RIGHT_IX] = False
+        self._bits &= ~self.RIGHT
 
     def stop_all(self):
-        self._data[self.FWD_IX] = False
-        self._data[self.REV_IX] = False
-        self._data[self.LEFT_IX] = False
-        self._data[self.RIGHT_IX] = False
+        self._bits = 0
 
 
 class RacerEngine:
+    __slots__ = ('player_state', 'track', '__game_over')
+
     def __init__(self, level):
         self.player_state = PlayerState(level)
         self.track = Track(level)
@@ -96,16 +115,24 @@ class RacerEngine:
 
 
 class PlayerState:
-    EMPTY_DELTAS = ((0, (-100, -100)),) * 2
+    __slots__ = ('x', 'y', 'rotation', 'speed', 'boundaries', 'is_alive', 'distance', 'last_deltas',
+                 '__rotation_matrix', '__position', '__last_rotation', '__cosine', '__sine', '__distance_tracker')
 
-    def __init__(self, level: Level):
+    EMPTY_DELTAS = 0, 0
+    EMPTY_LINE_POINTS = (-100, -100), (-100, -100)
+
+    def __init__(self, level: Level, track_distance=DEFAULT_TRACK_DISTANCE):
         self.x, self.y, self.rotation = level.single_car.x, level.single_car.y, level.single_car.rot
         self.speed = 0
-        self.boundaries = Polygon(np.reshape(CAR_BOUND_POINTS, (-1, 2)))
+        self.boundaries = np.reshape(CAR_BOUND_POINTS, (-1, 2)).astype(float)
+        self.__rotation_matrix = np.empty((2, 2))
+        self.__position = np.empty(2)
+        self.__last_rotation = None
+        self.__cosine = self.__sine = 0.0
         self.is_alive = True
         self.distance = 0
         self.last_deltas = self.EMPTY_DELTAS
-        self.__distance_tracker = DistanceTracker(level)
+        self.__distance_tracker = DistanceTracker(level) if track_distance else None
 
     @property
     def relevant_speed(self):
@@ -130,57 +157,136 @@ class PlayerState:
             allowed_rot = MAX_CAR_ROTATION * ((abs(self.speed) / MAX_CAR_SPEED) ** 0.5)
             self.rotation += allowed_rot * dt * turn_fact
 
-        rot = math.radians(self.rotation)
-        cosine, sine = math.cos(rot), math.sin(rot)
+        cosine, sine = self.__update_rotation__()
         self.x += cosine * self.speed * dt
         self.y -= sine * self.speed * dt
-        self.boundaries = create_collision_box(CAR_COLL_BOX, self.x, self.y, cosine, sine)
+        self.__update_boundaries__()
         self.__update_distance__()
 
+    def __update_rotation__(self):
+        if self.rotation != self.__last_rotation:
+            step = math.floor(self.rotation * ROTATION_STEPS_PER_DEGREE + 0.5) % ROTATION_STEPS
+            cosine, sine = COSINE_TABLE[step], SINE_TABLE[step]
+            matrix = self.__rotation_matrix
+            matrix[0, 0] = matrix[1, 1] = cosine
+            matrix[0, 1], matrix[1, 0] = -sine, sine
+            self.__cosine, self.__sine = cosine, sine
+            self.__last_rotation = self.rotation
+        return self.__cosine, self.__sine
+
+    def __update_boundaries__(self):
+        self.__position[0], self.__position[1] = self.x, self.y
+        np.dot(CAR_COLL_BOX, self.__rotation_matrix, out=self.boundaries)
+        self.boundaries += self.__position
+
     def __update_distance__(self):
+        if self.__distance_tracker is None:
+            return
         deltas = self.__distance_tracker.get_deltas(self.x, self.y)
-        self.distance += deltas[0][0] + deltas[1][0]
+        self.distance += deltas[0] + deltas[1]
         self.last_deltas = deltas
 
+    def line_points(self):
+        if self.__distance_tracker is None or self.last_deltas is self.EMPTY_DELTAS:
+            return self.EMPTY_LINE_POINTS
+        return self.__distance_tracker.get_line_points()
+
     def flattened_boundaries(self):
-        return np.array(self.boundaries.exterior.coords[:-1]).flatten()
+        return self.boundaries.ravel()
 
 
 class Track:
     def __init__(self, level: Level):
-        self.__outside = Polygon(np.reshape(level.outer_track, (-1, 2)))
-        self.__inside = Polygon(np.reshape(level.inner_track, (-1, 2)))
-        all_obstacles = create_obstacles_collision_boxes(level.obstacles)
-        self.__obstacles = list(filter(
-            lambda obs: self.__outside.intersects(obs) and not self.__inside.covers(obs),
-            all_obstacles))
-
-    def contains(self, geometry):
-        return self.__outside.contains(geometry) and \
-               not self.__inside.intersects(geometry) and \
-               not any([obs.intersects(geometry) for obs in self.__obstacles])
+        outside, inside = level.track_polygons
+        obstacles = list(filter(
+            lambda obs: outside.intersects(Polygon(obs)) and not inside.covers(Polygon(obs)),
+            create_obstacles_collision_boxes(level.obstacles)))
+        if track_contains:
+            obstacles = np.ascontiguousarray(np.reshape(obstacles, (-1, 4, 2)), dtype=np.float64)
+            self.__geometry = closed_ring(level.outer_xy), closed_ring(level.inner_xy), obstacles
+        else:
+            self.__outside = outside.bounds, prep(outside)
+            self.__inside = inside.bounds, prep(inside)
+            self.__obstacles = [(obs.bounds, prep(obs)) for obs in map(Polygon, obstacles)]
+
+    def contains(self, points):
+        if track_contains:
+            return track_contains(points, *self.__geometry)
+        xs, ys = points.T.tolist()
+        bounds = min(xs), min(ys), max(xs), max(ys)
+        if not bounds_within(bounds, self.__outside[0]):
+            return False
+        car = car_polygon(points)
+        return self.__outside[1].contains(car) and \
+               not (bounds_overlap(bounds, self.__inside[0]) and self.__inside[1].intersects(car)) and \
+               not any(bounds_overlap(bounds, obs_bounds) and obs.intersects(car)
+                       for obs_bounds, obs in self.__obstacles)
+
+
+def bounds_within(inner, outer):
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and inner[2] <= outer[2] and inner[3] <= outer[3]
+
+
+def bounds_overlap(bounds_a, bounds_b):
+    return bounds_a[0] <= bounds_b[2] and bounds_b[0] <= bounds_a[2] and \
+           bounds_a[1] <= bounds_b[3] and bounds_b[1] <= bounds_a[3]
 
 
 class DistanceTracker:
     def __init__(self, level: Level):
-        self.__outside_tracker = LineDistanceTracker(level.outer_track, level.outer_track_offset)
-        self.__inside_tracker = LineDistanceTracker(level.inner_track, level.inner_track_offset)
+        self.__outside_tracker = LineDistanceTracker(level.outer_xy, level.outer_track_offset)
+        self.__inside_tracker = LineDistanceTracker(level.inner_xy, level.inner_track_offset)
+        outside_xy, inside_xy = self.__outside_tracker.ring_xy, self.__inside_tracker.ring_xy
+        outside_len, inside_len = self.__outside_tracker.cum_len, self.__inside_tracker.cum_len
+        self.__rings = outside_xy, outside_len, inside_xy, inside_len
+        self.__projection = None if NUMBA_ENABLED else RingsProjection(*self.__rings)
 
     def get_deltas(self, x, y):
-        point = Point(x, y)
-        return self.__outside_tracker.get_delta(point), self.__inside_tracker.get_delta(point)
+        if self.__projection is None:
+            outside_dist, inside_dist = project_point_on_rings(x, y, *self.__rings)
+        else:
+            outside_dist, inside_dist = self.__projection.project(x, y)
+        return self.__outside_tracker.get_delta(outside_dist), self.__inside_tracker.get_delta(inside_dist)
+
+    def get_line_points(self):
+        return self.__outside_tracker.line_point(), self.__inside_tracker.line_point()
+
+
+class RingsProjection:
+    def __init__(self, outside_xy, outside_len, inside_xy, inside_len):
+        outside_xy, inside_xy = outside_xy.astype(np.float64), inside_xy.astype(np.float64)
+        self.__outside_segments = len(outside_xy) - 1
+        self.__seg_start = np.concatenate((outside_xy[:-1], inside_xy[:-1]))
+        self.__seg = np.concatenate((np.diff(outside_xy, axis=0), np.diff(inside_xy, axis=0)))
+        self.__seg_cum_len = np.concatenate((outside_len[:-1], inside_len[:-1]))
+        self.__seg_len = np.concatenate((np.diff(outside_len), np.diff(inside_len)))
+        seg_sq_len = (self.__seg * self.__seg).sum(axis=1)
+        self.__seg_sq_len_inv = np.divide(1, seg_sq_len, out=np.zeros_like(seg_sq_len), where=seg_sq_len > 0)
+
+    def project(self, x, y):
+        to_point = (x, y) - self.__seg_start
+        t = np.clip((to_point * self.__seg).sum(axis=1) * self.__seg_sq_len_inv, 0, 1)
+        offset = to_point - self.__seg * t[:, np.newaxis]
+        sq_dist = (offset * offset).sum(axis=1)
+        outside_ix = np.argmin(sq_dist[:self.__outside_segments])
+        inside_ix = self.__outside_segments + np.argmin(sq_dist[self.__outside_segments:])
+        seg_dist = self.__seg_cum_len + t * self.__seg_len
+        return seg_dist[outside_ix], seg_dist[inside_ix]
 
 
 class LineDistanceTracker:
     def __init__(self, track, offset):
-        self.__line = LinearRing(np.reshape(track, (-1, 2)))
+        self.ring_xy = closed_ring(track)
+        self.cum_len = cumulative_lengths(self.ring_xy)
         self.__prev_d = offset
-        self.__line_length = np.round(self.__line.length)
+        self.__line_length = np.round(self.cum_len[-1])
         self.__delta_limit = self.__line_length - 100
 
-    def get_delta(self, point):
-        dist = np.round(self.__line.project(point))
-        return self.__get_delta_score(dist), self.__get_line_point(dist)
+    def get_delta(self, dist):
+        return self.__get_delta_score(np.round(dist))
+
+    def line_point(self):
+        return self.__get_line_point(self.__prev_d)
 
     def __get_delta_score(self, dist):
         delta_score = dist - self.__prev_d
@@ -192,18 +298,21 @@ class LineDistanceTracker:
         return delta_score
 
     def __get_line_point(self, dist):
-        pts = self.__line.interpolate(dist)
-        return list(pts.coords)[0]
+        if NUMBA_ENABLED:
+            return interpolate_ring(self.ring_xy, self.cum_len, dist)
+        return self.__interpolate(dist)
+
+    def __interpolate(self, dist):
+        dist = min(max(dist, 0), self.cum_len[-1])
+        ix = min(max(np.searchsorted(self.cum_len, dist) - 1, 0), len(self.cum_len) - 2)
+        seg_len = self.cum_len[ix + 1] - self.cum_len[ix]
+        t = (dist - self.cum_len[ix]) / seg_len if seg_len > 0 else 0
+        x, y = self.ring_xy[ix] + (self.ring_xy[ix + 1] - self.ring_xy[ix]) * t
+        return x, y
 
 
 def create_collision_box(box, x, y, cosine, sine):
-    j = np.array([[cosine, sine], [-sine, cosine]])
-    new_boundaries = []
-    for ix in range(len(box)):
-        m = np.dot(j, box[ix])
-        moved = np.array((x, y)) + m.T
-        new_boundaries.append(moved)
-    return Polygon(new_boundaries)
+    return box @ np.array([[cosine, -sine], [sine, cosine]]) + (x, y)
 
 
 def create_obstacles_collision_boxes(obstacles):
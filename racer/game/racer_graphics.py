@@ -5,7 +5,7 @@ import pyglet
 from pyglet.graphics.vertexdomain import VertexList
 
 from .racer_engine import PlayerState, CAR_BOUND_POINTS, CAR_BOUNDS
-from .tracers import TracerLines
+from .tracers import TracerLines, TRACE_LINE_ANGLES
 from .tracks import Level
 
 resource_dir = path.join(path.abspath(path.dirname(__file__)), 'resources')
@@ -42,8 +42,8 @@ def create_vertex_list(points, color, vertices_mode='v2i', color_mode='c3B') ->
 
 
 class GraphicsElement:
-    def __init__(self):
-        self.batch = pyglet.graphics.Batch()
+    def __init__(self, batch=None):
+        self.batch = batch if batch else pyglet.graphics.Batch()
 
     def draw(self):
         self.batch.draw()
@@ -53,6 +53,33 @@ class GraphicsElement:
         return self.batch.add(pts_count, mode, group, vertices, color_data)
 
 
+class CarTransformGroup(pyglet.graphics.OrderedGroup):
+    def __init__(self, order, car_frame, parent=None):
+        super().__init__(order, parent)
+        self.car_frame = car_frame
+
+    def set_state(self):
+        pyglet.gl.glPushMatrix()
+        pyglet.gl.glTranslatef(self.car_frame.x, self.car_frame.y, 0)
+        pyglet.gl.glRotatef(-self.car_frame.rotation, 0, 0, 1.0)
+
+    def unset_state(self):
+        pyglet.gl.glPopMatrix()
+
+
+class RotationGroup(pyglet.graphics.OrderedGroup):
+    def __init__(self, order, angle, parent=None):
+        super().__init__(order, parent)
+        self.angle = angle
+
+    def set_state(self):
+        pyglet.gl.glPushMatrix()
+        pyglet.gl.glRotatef(self.angle, 0, 0, 1.0)
+
+    def unset_state(self):
+        pyglet.gl.glPopMatrix()
+
+
 class CarGraphics(GraphicsElement):
     TRACE_COLOR = 100, 100, 255
     DEAD_COLOR = 255, 70, 70
@@ -63,22 +90,30 @@ class CarGraphics(GraphicsElement):
     def __init__(self, num, level: Level, show_traces=True, show_collision_box=False):
         super().__init__()
         self.tracer = TracerLines(level) if show_traces else None
-        self.car_frame = pyglet.sprite.Sprite(img=car_frame_img, batch=self.batch)
+        self.trace_vertices = np.zeros((len(TRACE_LINE_ANGLES), 4), dtype=np.float32)
+        self.traces = create_vertex_list(self.trace_vertices.ravel().tolist(), self.TRACE_COLOR, vertices_mode='v2f/stream') \
+            if show_traces else None
+        self.car_frame = pyglet.sprite.Sprite(img=car_frame_img, batch=self.batch,
+                                              group=pyglet.graphics.OrderedGroup(1))
         self.car_frame.scale = 0.5
 
+        car_group = CarTransformGroup(0, self.car_frame)
         color_data = 'c3B', random_color() + random_color() + random_color() + random_color()
         pts, vertices, _ = convert_data(CAR_BOUND_POINTS)
-        self.car_color = pyglet.graphics.vertex_list(pts, vertices, color_data)
+        self.car_color = self.batch.add(pts, pyglet.gl.GL_QUADS, pyglet.graphics.OrderedGroup(0, car_group),
+                                        vertices, color_data)
         car_text = pyglet.text.decode_text(str(num))
         car_num_col = (255, 255, 255, 255) if np.average(color_data[1]) <= 127 else (0, 0, 0, 255)
         car_text.set_style(0, len(car_text.text), dict(font_name='Arial', font_size=8, color=car_num_col))
-        self.car_num = pyglet.text.layout.TextLayout(car_text, width=30)
+        self.car_num = pyglet.text.layout.TextLayout(car_text, width=30, batch=self.batch,
+                                                     group=RotationGroup(1, -90, car_group))
         self.car_num.x, self.car_num.y = -4, -2
 
         self.dead_x = [create_vertex_list(CAR_BOUND_POINTS, self.DEAD_BG_COLOR, color_mode='c4B'),
                        create_vertex_list(self.DEAD_X_LINE_1, self.DEAD_COLOR),
                        create_vertex_list(self.DEAD_X_LINE_2, self.DEAD_COLOR)]
         self.show_dead_x = False
+        self.__car_position = None
         self.collision_box = create_vertex_list(CAR_BOUND_POINTS, self.DEAD_COLOR, vertices_mode='v2f') \
             if show_collision_box else None
 
@@ -86,25 +121,19 @@ class CarGraphics(GraphicsElement):
         if self.tracer:
             self.__draw_traces()
 
-        self.__draw_at_car_position(self.__draw_car_frame)
         self.batch.draw()
         if self.collision_box:
             self.collision_box.draw(pyglet.gl.GL_POLYGON)
         if self.show_dead_x:
             self.__draw_at_car_position(self.__draw_dead_x)
 
-    def __draw_car_frame(self):
-        self.car_color.draw(pyglet.gl.GL_POLYGON)
-        pyglet.gl.glRotatef(-90, 0, 0, 1.0)
-        self.car_num.draw()
-
     def __draw_traces(self):
         pyglet.gl.glLineWidth(1)
-        for pos in self.tracer.get_trace_points(self.car_frame.position, self.car_frame.rotation):
-            pyglet.graphics.draw(2, pyglet.gl.GL_LINE_STRIP,
-                                 ('v2f', self.car_frame.position + pos),
-                                 ('c3B', self.TRACE_COLOR * 2)
-                                 )
+        position = self.car_frame.position
+        self.trace_vertices[:, :2] = position
+        self.trace_vertices[:, 2:] = self.tracer.get_trace_points(position, self.car_frame.rotation)
+        self.traces.vertices = self.trace_vertices.ravel()
+        self.traces.draw(pyglet.gl.GL_LINES)
 
     def __draw_dead_x(self):
         pyglet.gl.glLineWidth(5)
@@ -121,7 +150,10 @@ class CarGraphics(GraphicsElement):
         pyglet.gl.glPopMatrix()
 
     def update(self, player: PlayerState):
-        self.car_frame.update(x=player.x, y=player.y, rotation=player.rotation)
+        car_position = player.x, player.y, player.rotation
+        if car_position != self.__car_position:
+            self.__car_position = car_position
+            self.car_frame.update(x=player.x, y=player.y, rotation=player.rotation)
         self.show_dead_x = not player.is_alive
         if self.collision_box:
             self.collision_box.vertices = player.flattened_boundaries()
@@ -212,8 +244,8 @@ class ScoreBox(GraphicsElement):
     BG_COLOR = 50, 50, 200
     SCORE_BOX = 150, 40
 
-    def __init__(self, level: Level):
-        super().__init__()
+    def __init__(self, level: Level, batch=None):
+        super().__init__(batch)
         offset = np.array((level.width, level.height)) - self.SCORE_BOX
         box = np.append(offset, offset + self.SCORE_BOX)
 
@@ -226,9 +258,12 @@ class ScoreBox(GraphicsElement):
         center_y = offset[1] + self.SCORE_BOX[1] / 2
         self.label = pyglet.text.Label(x=center_x, y=center_y, anchor_x='center', anchor_y='center',
                                        batch=self.batch, group=foreground)
+        self.__score_text = None
 
     def update_text(self, score_text):
-        self.label.text = score_text
+        if score_text != self.__score_text:
+            self.__score_text = score_text
+            self.label.text = score_text
 
 
 class RankingBox(GraphicsElement):
@@ -236,18 +271,21 @@ class RankingBox(GraphicsElement):
     NAMES_WIDTH = 105
     SCORES_WIDTH = 30
 
-    def __init__(self, level: Level):
-        super().__init__()
+    def __init__(self, level: Level, batch=None):
+        super().__init__(batch)
         pos_x, pos_y = level.width - 150, level.height - 70
+        foreground = pyglet.graphics.OrderedGroup(1)
         self.names = pyglet.text.Label(x=pos_x, y=pos_y,
                                        width=self.NAMES_WIDTH, color=self.TEXT_COLOR, font_size=9,
-                                       batch=self.batch, multiline=True)
+                                       batch=self.batch, group=foreground, multiline=True)
         self.scores = pyglet.text.Label(x=pos_x + self.NAMES_WIDTH, y=pos_y,
                                         width=self.SCORES_WIDTH, color=self.TEXT_COLOR, font_size=9,
-                                        batch=self.batch, multiline=True)
+                                        batch=self.batch, group=foreground, multiline=True)
+        self.__ranking = None
 
     def update(self, ranking):
-        if ranking:
+        if ranking and ranking != self.__ranking:
+            self.__ranking = ranking
             self.names.text, self.scores.text = ranking
 
 
@@ -274,14 +312,13 @@ class Indicators(GraphicsElement):
 
         if state.is_alive:
             inner_delta, outer_delta = state.last_deltas
+            inner_point, outer_point = state.line_points()
 
-            delta_score, (px, py) = inner_delta
-            self.inner_score += delta_score
-            self.inner_pointer.update(px, py, '{:.1f}'.format(self.inner_score))
+            self.inner_score += inner_delta
+            self.inner_pointer.update(*inner_point, '{:.1f}'.format(self.inner_score))
 
-            delta_score, (px, py) = outer_delta
-            self.outer_score += delta_score
-            self.outer_pointer.update(px, py, '{:.1f}'.format(self.outer_score))
+            self.outer_score += outer_delta
+            self.outer_pointer.update(*outer_point, '{:.1f}'.format(self.outer_score))
 
 
 class Pointer:
@@ -76,21 +76,21 @@ class RacerWindow(pyglet.window.Window):
         self.show_warmup_screen = show_warmup_screen
         self.warmup = WarmupControl(controller.level, show_warmup_screen)
         self.track = TrackGraphics(controller.level)
-        self.score_box = ScoreBox(controller.level)
+        self.hud = pyglet.graphics.Batch()
+        self.score_box = ScoreBox(controller.level, self.hud)
 
         car_count = self.controller.get_player_count()
         self.cars = [CarGraphics(ix + 1, controller.level, show_traces=show_traces)
                      for ix in range(car_count)]
         self.pause_overlay = GameOverlay(controller.level, 'Paused', '"p" to continue...')
-        self.end_overlay = None
+        self.end_overlay, self.end_text = None, None
         self.fps_display = pyglet.window.FPSDisplay(window=self) if show_fps else None
         self.indicator = Indicators() if ENABLE_INDICATORS else None
-        self.ranking = RankingBox(controller.level)
+        self.ranking = RankingBox(controller.level, self.hud)
 
         self.controller.set_reset_hook(self.on_reset)
 
     def on_reset(self):
-        self.end_overlay = None
         self.warmup.reset()
         if self.indicator:
             self.indicator.reset()
@@ -111,14 +111,14 @@ class RacerWindow(pyglet.window.Window):
         if self.warmup.show:
             self.warmup.screen.draw()
         elif self.controller.show_end_screen:
-            if not self.end_overlay:
-                self.end_overlay = GameOverlay(self.controller.level, *self.controller.get_end_text())
+            end_text = self.controller.get_end_text()
+            if end_text != self.end_text:
+                self.end_overlay, self.end_text = GameOverlay(self.controller.level, *end_text), end_text
             self.end_overlay.draw()
         elif self.controller.show_paused_screen:
             self.pause_overlay.draw()
 
-        self.score_box.draw()
-        self.ranking.draw()
+        self.hud.draw()
         if self.fps_display:
             self.fps_display.draw()
         if self.indicator:
@@ -2,16 +2,29 @@ import math
 from functools import reduce
 
 import numpy as np
-from shapely.geometry import LineString
+from shapely.geometry import LineString, LinearRing
+from shapely.prepared import prep
 
-from .racer_engine import create_obstacles_collision_boxes
+from ._geom_numba import NUMBA_ENABLED, trace_distances as nb_trace_distances
+from .racer_engine import ENGINE_CORE_ENABLED, create_obstacles_collision_boxes
 from .tracks import Level
 
+if ENGINE_CORE_ENABLED:
+    from ._engine_core import trace_distances as cy_trace_distances
+
+if NUMBA_ENABLED:
+    trace_distances = nb_trace_distances
+elif ENGINE_CORE_ENABLED:
+    trace_distances = cy_trace_distances
+else:
+    trace_distances = None
+
 DEG_15 = math.pi / 12
 DEG_30 = math.pi / 6
 DEG_60 = math.pi / 3
 DEG_90 = math.pi / 2
 TRACE_LINE_ANGLES = [DEG_90, DEG_60, DEG_30, DEG_15, 0, -DEG_15, -DEG_30, -DEG_60, -DEG_90]
+TRACE_ANGLES_ARRAY = np.array(TRACE_LINE_ANGLES)
 
 
 class TracerLines:
@@ -19,14 +32,21 @@ class TracerLines:
         self.trace_len = level.width
         obstacle_coll_boxes = create_obstacles_collision_boxes(level.obstacles)
         self.collision_boxes = [
-            LineString(np.reshape(level.outer_track, (-1, 2))),
-            LineString(np.reshape(level.inner_track, (-1, 2))),
-            *[LineString(coll_box.exterior.coords) for coll_box in obstacle_coll_boxes]
+            *level.track_rings,
+            *[LinearRing(coll_box) for coll_box in obstacle_coll_boxes]
         ]
+        self.__prepared_boxes = [prep(box) for box in self.collision_boxes]
+        self.__segments = np.concatenate([ring_segments(box) for box in self.collision_boxes])
 
-    def get_trace_distances(self, pos, rotation_grad):
+    def get_trace_distances(self, pos, rotation_grad, out=None):
         rot = math.radians(rotation_grad)
-        return [self.__closest_distance_on_line(pos, rot + angle) for angle in TRACE_LINE_ANGLES]
+        if out is None:
+            out = np.empty(len(TRACE_LINE_ANGLES))
+        if trace_distances:
+            return trace_distances(pos[0], pos[1], rot, TRACE_ANGLES_ARRAY, self.__segments, self.trace_len, out)
+        for ix, angle in enumerate(TRACE_LINE_ANGLES):
+            out[ix] = self.__closest_distance_on_line(pos, rot + angle)
+        return out
 
     def get_trace_points(self, pos, rotation_grad):
         rot = math.radians(rotation_grad)
@@ -48,10 +68,14 @@ class TracerLines:
     def __cross_points_on_line(self, pos, rot):
         trace_target = (pos[0] + math.cos(rot) * self.trace_len, pos[1] - math.sin(rot) * self.trace_len)
         tracer = LineString([pos, trace_target])
-        intersections = [box.intersection(tracer) for box in self.collision_boxes]
-        candidates = reduce(lambda all_xs, curr_xs: all_xs.union(curr_xs), intersections)
-
+        intersections = [box.intersection(tracer)
+                         for box, prepared in zip(self.collision_boxes, self.__prepared_boxes)
+                         if prepared.intersects(tracer)]
         cross_pts = []
+        if not intersections:
+            return cross_pts
+
+        candidates = reduce(lambda all_xs, curr_xs: all_xs.union(curr_xs), intersections)
         if not candidates.is_empty:
             if hasattr(candidates, 'geoms'):
                 for pts in getattr(candidates, 'geoms'):
@@ -60,3 +84,8 @@ class TracerLines:
                 cross_pts.append((candidates.x, candidates.y))
 
         return cross_pts
+
+
+def ring_segments(ring):
+    coords = np.array(ring.coords[:], dtype=np.float64)
+    return np.hstack((coords[:-1], coords[1:]))
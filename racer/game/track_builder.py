@@ -128,7 +128,7 @@ class CarAdapter:
     def __init__(self, batch, level, label_x, label_y):
         self.car_graphics = CarGraphics(1, level, show_traces=False)
         self.operation = PlayerOperation()
-        self.state = PlayerState(level)
+        self.state = PlayerState(level, track_distance=False)
         self.car_lbl = CoordinateLabel(batch, 'Car:', label_x, label_y)
 
     def on_key_press(self, symbol):
@@ -1,5 +1,11 @@
 from typing import Tuple, List
 
+import numpy as np
+import shapely
+from shapely.geometry import Polygon, LinearRing
+
+SHAPELY_2 = int(shapely.__version__.split('.')[0]) >= 2
+
 
 class TrackPosition:
     def __init__(self, x, y, rot):
@@ -26,6 +32,47 @@ class Level:
         self.single_car = single_car
         self.two_cars = two_cars
         self.obstacles = obstacles
+        self.__geometry = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_Level__geometry'] = None
+        return state
+
+    @property
+    def outer_xy(self):
+        return self.__get_geometry().outer_xy
+
+    @property
+    def inner_xy(self):
+        return self.__get_geometry().inner_xy
+
+    @property
+    def track_rings(self):
+        return self.__get_geometry().rings
+
+    @property
+    def track_polygons(self):
+        return self.__get_geometry().polygons
+
+    def __get_geometry(self):
+        if self.__geometry is None:
+            self.__geometry = TrackGeometry(self.outer_track, self.inner_track)
+        return self.__geometry
+
+
+class TrackGeometry:
+    def __init__(self, outer_track, inner_track):
+        self.outer_xy = np.ascontiguousarray(np.reshape(outer_track, (-1, 2)), dtype=np.float32)
+        self.inner_xy = np.ascontiguousarray(np.reshape(inner_track, (-1, 2)), dtype=np.float32)
+        if SHAPELY_2:
+            indices = np.repeat((0, 1), (len(self.outer_xy), len(self.inner_xy)))
+            rings = shapely.linearrings(np.concatenate((self.outer_xy, self.inner_xy)), indices=indices)
+            self.rings = tuple(rings)
+            self.polygons = tuple(shapely.polygons(rings))
+        else:
+            self.rings = LinearRing(self.outer_xy), LinearRing(self.inner_xy)
+            self.polygons = Polygon(self.outer_xy), Polygon(self.inner_xy)
 
 
 __empty_level = Level(
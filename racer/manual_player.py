@@ -110,6 +110,8 @@ class ManualController(RaceController):
 
 
 class ManualPlayer:
+    __slots__ = ('engine', 'name', 'score', 'up', 'down', 'left', 'right', '__operation')
+
     def __init__(self, level: Level, player_id, start_pos: TrackPosition, up, down, left, right):
         self.engine = RacerEngine(level)
         self.name = 'Player {}'.format(player_id)
@@ -1,9 +1,10 @@
 from signal import signal, SIGINT
 
 import neat
+import numpy as np
 
 from game.racer_engine import RacerEngine, PlayerOperation
-from game.tracers import TracerLines
+from game.tracers import TracerLines, TRACE_LINE_ANGLES
 from .training_dts import random_dt
 
 MIN_SCORE_PER_SECOND = 20
@@ -14,6 +15,9 @@ SCORE_CHECK_DIFF = 4
 
 
 class NeuralPlayer:
+    __slots__ = ('name', 'engine', 'tracers', 'net', 'net_input', 'operations', 'time', 'score', 'score_limit',
+                 'score_history')
+
     STOPPING = False
 
     @staticmethod
@@ -33,6 +37,7 @@ class NeuralPlayer:
         self.engine = RacerEngine(level)
         self.tracers = TracerLines(level)
         self.net = neat.nn.FeedForwardNetwork.create(genome, config)
+        self.net_input = np.empty(len(TRACE_LINE_ANGLES))
         self.operations = PlayerOperation()
         self.time = 0
         self.score = 0
@@ -54,8 +59,8 @@ class NeuralPlayer:
     def next_step(self, dt):
         self.time += dt
         state = self.engine.player_state
-        net_input = self.tracers.get_trace_distances((state.x, state.y), state.rotation)
-        net_output = self.net.activate(net_input)
+        net_input = self.tracers.get_trace_distances((state.x, state.y), state.rotation, out=self.net_input)
+        net_output = self.net.activate(net_input.tolist())
 
         self.__update_operations(*net_output)
         self.engine.update(dt, self.operations)
@@ -85,16 +90,13 @@ class NeuralPlayer:
         return self.score < 0 or \
                (self.score_limit and self.score >= self.score_limit)
 
-    def __get_score_per_second(self):
-        return self.score / self.time
-
     def __under_sps_limit(self):
-        if self.time > MIN_SPS_OFFSET:
-            return self.__get_score_per_second() < MIN_SCORE_PER_SECOND
-        return False
+        return self.time > MIN_SPS_OFFSET and self.score < MIN_SCORE_PER_SECOND * self.time
 
 
 class ScoreHistory:
+    __slots__ = ('time', 'prev_score')
+
     def __init__(self):
         self.time = 0
         self.prev_score = 0
@@ -8,9 +8,38 @@ LIMITS_DIGITS = 3
 LIMIT_LOW = 0.010
 LIMIT_HIGH = 0.060
 
+DT_BUFFER_SIZE = 8192
+
+__rng = np.random.default_rng()
+__dt_buffer = []
+__dt_ix = 0
+
+
+def init_random_dts(seed=None):
+    global __rng, __dt_buffer, __dt_ix
+    __rng = np.random.default_rng(seed)
+    __dt_buffer, __dt_ix = [], 0
+
 
 def random_dt():
-    return __random_dt()
+    global __dt_buffer, __dt_ix
+    if __dt_ix >= len(__dt_buffer):
+        __dt_buffer, __dt_ix = __sample_dts(DT_BUFFER_SIZE).tolist(), 0
+    dt = __dt_buffer[__dt_ix]
+    __dt_ix += 1
+    return dt
+
+
+def __sample_dts(size):
+    ixs = np.searchsorted(DISTRIBUTION_RATIOS, __rng.random(size), side='right')
+    means, deviations = np.take(MEANS, ixs), np.take(DEVIATIONS, ixs)
+    dts = __rng.normal(means, deviations)
+    rejected = np.arange(size)
+    while len(rejected):
+        round_dts = np.round(dts[rejected], LIMITS_DIGITS)
+        rejected = rejected[(round_dts < LIMIT_LOW) | (round_dts > LIMIT_HIGH)]
+        dts[rejected] = __rng.normal(means[rejected], deviations[rejected])
+    return dts
 
 
 def __random_dt(ix=None):
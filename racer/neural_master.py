@@ -12,7 +12,7 @@ from game.tracks import Level, Trainings, SHOWCASE_FROM_FILE_LEVEL
 from neural.best_player_keep import BestPlayerKeep, PlayerData, load_player_data
 from neural.neural_player import NeuralPlayer
 from neural.training_configs import load_configs
-from neural.training_dts import LIMIT_HIGH
+from neural.training_dts import LIMIT_HIGH, init_random_dts
 from neural.training_reporter import TrainingReporter
 
 DT_IGNORE_LIMIT = LIMIT_HIGH
@@ -28,7 +28,7 @@ class NeuralMaster:
 
         self.pool = None
         signal(SIGINT, self.stop)
-        self.pool = Pool(processes=self.training_config.processes)
+        self.pool = Pool(processes=self.training_config.processes, initializer=init_random_dts)
 
     def train(self):
         population = neat.Population(self.neat_config)
@@ -104,7 +104,7 @@ class NeuralMaster:
         fitness_log = ['#{} ({:.0f})'.format(data.genome.key, data.fitness) for data in players]
         print('Showcase: {} players, key (fitness): {}'.format(len(players), ', '.join(fitness_log)))
         try:
-            ShowcaseController(players, self.pool, level, limit, auto_close).showcase()
+            ShowcaseController(players, level, limit, auto_close).showcase()
         except Exception as e:
             if str(e) == 'list index out of range':
                 print('Showcase error: no screen available')
@@ -116,11 +116,10 @@ class NeuralMaster:
 class ShowcaseController(RaceController):
     DELAY_AUTO_CLOSE_SECS = 3
 
-    def __init__(self, players: List[PlayerData], pool: Pool, level: Level, limit: int, auto_close: bool):
+    def __init__(self, players: List[PlayerData], level: Level, limit: int, auto_close: bool):
         super().__init__(level)
         self.__neural_player = [NeuralPlayer(data.genome, data.config, level, limit, name=data.name)
                                 for data in players]
-        self.__pool = pool
         self.window = RacerWindow(self, show_fps=True)
         self.auto_close = auto_close
         self.seconds_to_close = self.DELAY_AUTO_CLOSE_SECS
@@ -151,8 +150,9 @@ class ShowcaseController(RaceController):
                 self.window.close()
                 self.closing = True
         else:
-            pool_params = [(player, dt) for player in self.__neural_player]
-            self.__neural_player = self.__pool.starmap(update_player_state, pool_params)
+            for player in self.__neural_player:
+                if not player.engine.game_over:
+                    player.next_step(dt)
             self.show_end_screen = all([player.engine.game_over for player in self.__neural_player])
 
     def get_player_states(self) -> List[PlayerState]:
@@ -166,9 +166,3 @@ class ShowcaseController(RaceController):
             return '', 'waiting {} seconds to exit...'.format(self.DELAY_AUTO_CLOSE_SECS), ''
         else:
             return '', ''
-
-
-def update_player_state(player, dt):
-    if not player.engine.game_over:
-        player.next_step(dt)
-    return player
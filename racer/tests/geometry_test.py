@@ -0,0 +1,123 @@
+import math
+import random
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from shapely.geometry import LinearRing, Point, Polygon
+
+import game.racer_engine as racer_engine
+import game.tracers as tracers
+from game._geom_numba import NUMBA_ENABLED, closed_ring, cumulative_lengths, interpolate_ring, project_point_on_rings
+from game.racer_engine import ENGINE_CORE_ENABLED, CAR_COLL_BOX, RingsProjection, Track, \
+    create_obstacles_collision_boxes
+from game.tracers import TracerLines
+from game.tracks import MANUAL_LEVELS
+
+RANDOM_POSES = 300
+OBSTACLE_POSES = 100
+OBSTACLE_OFFSET = 45
+DISTANCE_DELTA = 1e-6
+
+
+def random_poses(level, rnd):
+    poses = [(rnd.uniform(0, level.width), rnd.uniform(0, level.height), rnd.uniform(0, 360))
+             for _ in range(RANDOM_POSES)]
+    for obstacle in level.obstacles:
+        poses += [(obstacle.x + rnd.uniform(-OBSTACLE_OFFSET, OBSTACLE_OFFSET),
+                   obstacle.y + rnd.uniform(-OBSTACLE_OFFSET, OBSTACLE_OFFSET), rnd.uniform(0, 360))
+                  for _ in range(OBSTACLE_POSES)]
+    return poses
+
+
+def car_points(x, y, rotation):
+    rot = math.radians(rotation)
+    cosine, sine = math.cos(rot), math.sin(rot)
+    return np.ascontiguousarray(CAR_COLL_BOX @ np.array([[cosine, -sine], [sine, cosine]]) + (x, y))
+
+
+def shapely_track_contains(level, points):
+    outside = Polygon(np.reshape(level.outer_track, (-1, 2)))
+    inside = Polygon(np.reshape(level.inner_track, (-1, 2)))
+    obstacles = [Polygon(box) for box in create_obstacles_collision_boxes(level.obstacles)]
+    car = Polygon(points)
+    return outside.contains(car) and not inside.intersects(car) and \
+           not any(obs.intersects(car) for obs in obstacles if outside.intersects(obs) and not inside.covers(obs))
+
+
+class TrackContainsTestCase(unittest.TestCase):
+    def assert_track_contains(self, backend):
+        rnd = random.Random(1)
+        with patch.object(racer_engine, 'track_contains', backend):
+            for level in MANUAL_LEVELS:
+                track = Track(level)
+                for pose in random_poses(level, rnd):
+                    points = car_points(*pose)
+                    self.assertEqual(shapely_track_contains(level, points), bool(track.contains(points)),
+                                     f'{level.name}: {pose}')
+
+    def test_shapely_contains(self):
+        self.assert_track_contains(None)
+
+    @unittest.skipUnless(NUMBA_ENABLED, 'numba not installed')
+    def test_numba_contains(self):
+        self.assert_track_contains(racer_engine.nb_track_contains)
+
+    @unittest.skipUnless(ENGINE_CORE_ENABLED, 'native engine core not built')
+    def test_cython_contains(self):
+        self.assert_track_contains(racer_engine.cy_track_contains)
+
+
+class DistanceProjectionTestCase(unittest.TestCase):
+    def assert_projection(self, project):
+        rnd = random.Random(2)
+        for level in MANUAL_LEVELS:
+            outer_xy, inner_xy = closed_ring(level.outer_xy), closed_ring(level.inner_xy)
+            rings = outer_xy, cumulative_lengths(outer_xy), inner_xy, cumulative_lengths(inner_xy)
+            outer_ring, inner_ring = LinearRing(outer_xy), LinearRing(inner_xy)
+            for x, y, _ in random_poses(level, rnd):
+                outer_dist, inner_dist = project(rings, x, y)
+                self.assertAlmostEqual(outer_ring.project(Point(x, y)), outer_dist, delta=DISTANCE_DELTA)
+                self.assertAlmostEqual(inner_ring.project(Point(x, y)), inner_dist, delta=DISTANCE_DELTA)
+
+    def test_numpy_projection(self):
+        self.assert_projection(lambda rings, x, y: RingsProjection(*rings).project(x, y))
+
+    @unittest.skipUnless(NUMBA_ENABLED, 'numba not installed')
+    def test_numba_projection(self):
+        self.assert_projection(lambda rings, x, y: project_point_on_rings(x, y, *rings))
+
+    @unittest.skipUnless(NUMBA_ENABLED, 'numba not installed')
+    def test_numba_interpolation(self):
+        rnd = random.Random(3)
+        for level in MANUAL_LEVELS:
+            ring_xy = closed_ring(level.outer_xy)
+            cum_len = cumulative_lengths(ring_xy)
+            ring = LinearRing(ring_xy)
+            for _ in range(RANDOM_POSES):
+                dist = rnd.uniform(0, cum_len[-1])
+                expected = ring.interpolate(dist)
+                x, y = interpolate_ring(ring_xy, cum_len, dist)
+                self.assertAlmostEqual(expected.x, x, delta=DISTANCE_DELTA)
+                self.assertAlmostEqual(expected.y, y, delta=DISTANCE_DELTA)
+
+
+class TraceDistancesTestCase(unittest.TestCase):
+    def assert_trace_distances(self, backend):
+        rnd = random.Random(4)
+        for level in MANUAL_LEVELS:
+            tracer = TracerLines(level)
+            for x, y, rotation in random_poses(level, rnd):
+                with patch.object(tracers, 'trace_distances', None):
+                    expected = tracer.get_trace_distances((x, y), rotation)
+                with patch.object(tracers, 'trace_distances', backend):
+                    actual = tracer.get_trace_distances((x, y), rotation)
+                np.testing.assert_allclose(actual, expected, rtol=0, atol=DISTANCE_DELTA)
+
+    @unittest.skipUnless(NUMBA_ENABLED, 'numba not installed')
+    def test_numba_trace_distances(self):
+        self.assert_trace_distances(tracers.nb_trace_distances)
+
+    @unittest.skipUnless(ENGINE_CORE_ENABLED, 'native engine core not built')
+    def test_cython_trace_distances(self):
+        self.assert_trace_distances(tracers.cy_trace_distances)